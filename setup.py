@@ -29,7 +29,7 @@ setup(
     package_dir={"": "src"},
     include_package_data=True,
     zip_safe=False,
-    python_requires=">=3.6.2, <4",
+    python_requires=">=3.7, <4",
     install_requires=[
         "chardet",
         "click>=7.1.1, <8",
@@ -38,6 +38,7 @@ setup(
         "keyring==18.0.1",
         "keyrings.alt==3.2.0",
         "ipython==7.16.3",
+        "orjson>=3.6.1",
         "pandas>=1.1.3",
         "py42>=1.23.0",
     ],
@@ -62,7 +63,6 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.6",
         "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: Implementation :: CPython",
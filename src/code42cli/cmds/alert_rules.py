@@ -1,5 +1,3 @@
-from collections import OrderedDict
-
 import click
 from click import echo
 from py42.exceptions import Py42BadRequestError
@@ -23,13 +21,14 @@ class AlertRuleTypes:
     FILE_TYPE_MISMATCH = "FED_FILE_TYPE_MISMATCH"
 
 
-_HEADER_KEYS_MAP = OrderedDict()
-_HEADER_KEYS_MAP["observerRuleId"] = "RuleId"
-_HEADER_KEYS_MAP["name"] = "Name"
-_HEADER_KEYS_MAP["severity"] = "Severity"
-_HEADER_KEYS_MAP["type"] = "Type"
-_HEADER_KEYS_MAP["ruleSource"] = "Source"
-_HEADER_KEYS_MAP["isEnabled"] = "Enabled"
+_HEADER_KEYS_MAP = {
+    "observerRuleId": "RuleId",
+    "name": "Name",
+    "severity": "Severity",
+    "type": "Type",
+    "ruleSource": "Source",
+    "isEnabled": "Enabled",
+}
 
 
 @click.group(cls=OrderedGroup)
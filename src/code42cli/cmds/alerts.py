@@ -1,3 +1,6 @@
+from functools import lru_cache
+from functools import reduce
+
 import click
 import py42.sdk.queries.alerts.filters as f
 from py42.exceptions import Py42NotFoundError
@@ -33,6 +36,10 @@ from code42cli.util import warn_interrupt
 ALERTS_KEYWORD = "alerts"
 ALERT_PAGE_SIZE = 25
 
+_SEVERITY_CHOICES = tuple(Severity.choices())
+_ALERT_STATE_CHOICES = tuple(AlertState.choices())
+_RULE_TYPE_CHOICES = tuple(RuleType.choices())
+
 begin = opt.begin_option(
     ALERTS_KEYWORD,
     callback=lambda ctx, param, arg: convert_datetime_to_timestamp(
@@ -45,7 +52,7 @@ advanced_query = searchopt.advanced_query_option(ALERTS_KEYWORD)
 severity_option = click.option(
     "--severity",
     multiple=True,
-    type=click.Choice(Severity.choices()),
+    type=click.Choice(_SEVERITY_CHOICES),
     cls=searchopt.AdvancedQueryAndSavedSearchIncompatible,
     callback=searchopt.is_in_filter(f.Severity),
     help="Filter alerts by severity. Defaults to returning all severities.",
@@ -53,7 +60,7 @@ severity_option = click.option(
 filter_state_option = click.option(
     "--state",
     multiple=True,
-    type=click.Choice(AlertState.choices()),
+    type=click.Choice(_ALERT_STATE_CHOICES),
     cls=searchopt.AdvancedQueryAndSavedSearchIncompatible,
     callback=searchopt.is_in_filter(f.AlertState),
     help="Filter alerts by status. Defaults to returning all statuses.",
@@ -119,7 +126,7 @@ exclude_rule_id_option = click.option(
 rule_type_option = click.option(
     "--rule-type",
     multiple=True,
-    type=click.Choice(RuleType.choices()),
+    type=click.Choice(_RULE_TYPE_CHOICES),
     cls=searchopt.AdvancedQueryAndSavedSearchIncompatible,
     callback=searchopt.is_in_filter(f.RuleType),
     help="Filter alerts by including the given rule type(s).",
@@ -150,7 +157,7 @@ note_option = click.option("--note", help="A note to attach to the alert.")
 update_state_option = click.option(
     "--state",
     help="The state to give to the alert.",
-    type=click.Choice(AlertState.choices()),
+    type=click.Choice(_ALERT_STATE_CHOICES),
 )
 
 
@@ -166,29 +173,34 @@ def _get_default_output_header():
     }
 
 
+_SEARCH_OPTIONS = (checkpoint, advanced_query, end, begin)
+_FILTER_OPTIONS = (
+    actor_option,
+    actor_contains_option,
+    exclude_actor_option,
+    exclude_actor_contains_option,
+    rule_name_option,
+    exclude_rule_name_option,
+    rule_id_option,
+    exclude_rule_id_option,
+    rule_type_option,
+    exclude_rule_type_option,
+    description_option,
+    severity_option,
+    filter_state_option,
+)
+
+
+def _apply_options(options, f):
+    return reduce(lambda decorated, option: option(decorated), options, f)
+
+
 def search_options(f):
-    f = checkpoint(f)
-    f = advanced_query(f)
-    f = end(f)
-    f = begin(f)
-    return f
+    return _apply_options(_SEARCH_OPTIONS, f)
 
 
 def filter_options(f):
-    f = actor_option(f)
-    f = actor_contains_option(f)
-    f = exclude_actor_option(f)
-    f = exclude_actor_contains_option(f)
-    f = rule_name_option(f)
-    f = exclude_rule_name_option(f)
-    f = rule_id_option(f)
-    f = exclude_rule_id_option(f)
-    f = rule_type_option(f)
-    f = exclude_rule_type_option(f)
-    f = description_option(f)
-    f = severity_option(f)
-    f = filter_state_option(f)
-    return f
+    return _apply_options(_FILTER_OPTIONS, f)
 
 
 @click.group(cls=OrderedGroup)
@@ -253,13 +265,9 @@ def search(
         alerts_gen = _dedupe_checkpointed_events_and_store_updated_checkpoint(
             cursor, checkpoint_name, alerts_gen
         )
-    alerts_list = []
-    for alert in alerts_gen:
-        alerts_list.append(alert)
-    if not alerts_list:
+    # sending to pager when checkpointing can be inaccurate due to pager buffering, so disallow pager
+    if not formatter.echo_formatted_iterable(alerts_gen, force_no_pager=use_checkpoint):
         click.echo("No results found.")
-        return
-    formatter.echo_formatted_list(alerts_list)
 
 
 def _construct_query(state, begin, end, advanced_query, or_query):
@@ -343,10 +351,11 @@ def send_to(cli_state, begin, end, advanced_query, use_checkpoint, or_query, **k
         alerts_gen = _dedupe_checkpointed_events_and_store_updated_checkpoint(
             cursor, checkpoint_name, alerts_gen
         )
+    log_info = cli_state.logger.info
     with warn_interrupt():
         alert = None
         for alert in alerts_gen:
-            cli_state.logger.info(alert)
+            log_info(alert)
         if alert is None:  # generator was empty
             click.echo("No results found.")
 
@@ -355,6 +364,9 @@ def _get_cursor(state, use_checkpoint):
     return _get_alert_cursor_store(state.profile.name) if use_checkpoint else None
 
 
+# a single command may ask for the same profile's store several times (e.g. `--begin` validation
+# and the command itself); stores only hold their directory path, so they are safe to share.
+@lru_cache(maxsize=4)
 def _get_alert_cursor_store(profile_name):
     return AlertCursorStore(profile_name)
 
@@ -202,10 +202,11 @@ def send_to(
         events = _dedupe_checkpointed_events_and_store_updated_checkpoint(
             cursor, checkpoint_name, events
         )
+    log_info = state.logger.info
     with warn_interrupt():
         event = None
         for event in events:
-            state.logger.info(event)
+            log_info(event)
         if event is None:  # generator was empty
             click.echo("No results found.")
 
@@ -214,19 +215,20 @@ def _get_all_audit_log_events(sdk, **filter_args):
     response_gen = sdk.auditlogs.get_all(**filter_args)
     events = []
     try:
-        responses = list(response_gen)
+        # Pull events out of each page as it arrives so only one raw response is held
+        # in memory at a time, rather than buffering every page before extracting.
+        for response in response_gen:
+            response_events = response.data.get(EVENT_KEY)
+            if response_events:
+                events.extend(response_events)
     except KeyError:
         # API endpoint (get_page) returns a response without events key when no records are found
         # e.g {"paginationRangeStartIndex": 10000, "paginationRangeEndIndex": 10000, "totalResultCount": 1593}
         # we can remove this check once PL-93211 is resolved and deployed.
-        return events
-
-    for response in responses:
-        if EVENT_KEY in response.data:
-            response_events = response.data.get(EVENT_KEY)
-            events.extend(response_events)
+        pass
 
-    return sorted(events, key=lambda x: x.get("timestamp"))
+    events.sort(key=lambda x: x.get("timestamp"))
+    return events
 
 
 def _dedupe_checkpointed_events_and_store_updated_checkpoint(
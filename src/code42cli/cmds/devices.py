@@ -1,12 +1,6 @@
 from datetime import date
 
 import click
-import numpy as np
-from pandas import concat
-from pandas import DataFrame
-from pandas import json_normalize
-from pandas import Series
-from pandas import to_datetime
 from py42 import exceptions
 from py42.clients.settings.device_settings import IncydrDeviceSettings
 from py42.exceptions import Py42NotFoundError
@@ -343,6 +337,8 @@ def list_devices(
     format,
 ):
     """Get information about many devices."""
+    from pandas import to_datetime
+
     if inactive:
         active = False
     columns = [
@@ -393,6 +389,9 @@ def list_devices(
 
 
 def _add_legal_hold_membership_to_device_dataframe(sdk, df):
+    from numpy import nan
+    from pandas import json_normalize
+
     columns = ["legalHold.legalHoldUid", "legalHold.name", "user.userUid"]
 
     legal_hold_member_dataframe = (
@@ -414,7 +413,7 @@ def _add_legal_hold_membership_to_device_dataframe(sdk, df):
         right_on="user.userUid",
     )
 
-    df.loc[df["status"] == "Deactivated", ["legalHoldUid", "legalHoldName"]] = np.nan
+    df.loc[df["status"] == "Deactivated", ["legalHoldUid", "legalHoldName"]] = nan
 
     return df
 
@@ -431,6 +430,8 @@ def _get_all_active_hold_memberships(sdk):
 def _get_device_dataframe(
     sdk, columns, active=None, org_uid=None, include_backup_usage=False
 ):
+    from pandas import DataFrame
+
     devices_generator = sdk.devices.get_all(
         active=active, include_backup_usage=include_backup_usage, org_uid=org_uid
     )
@@ -443,6 +444,8 @@ def _get_device_dataframe(
 
 
 def _add_settings_to_dataframe(sdk, device_dataframe):
+    from pandas import DataFrame
+
     macos_guids = device_dataframe.loc[
         device_dataframe["osName"] == "mac", "guid"
     ].values
@@ -473,6 +476,8 @@ def _add_settings_to_dataframe(sdk, device_dataframe):
 
 
 def _add_usernames_to_device_dataframe(sdk, device_dataframe):
+    from pandas import DataFrame
+
     users_generator = sdk.users.get_all()
     users_list = []
     for page in users_generator:
@@ -494,6 +499,8 @@ def _add_storage_totals_to_dataframe(df, include_backup_usage):
 
 
 def _break_backup_usage_into_total_storage(backup_usage):
+    from pandas import Series
+
     total_storage = 0
     archive_count = 0
     for archive in backup_usage:
@@ -531,6 +538,9 @@ def list_backup_sets(
 
 
 def _add_backup_set_settings_to_dataframe(sdk, devices_dataframe):
+    from pandas import concat
+    from pandas import DataFrame
+
     rows = [{"guid": guid} for guid in devices_dataframe["guid"].values]
 
     def handle_row(guid):
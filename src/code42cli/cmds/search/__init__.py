@@ -1,14 +1,22 @@
+from contextlib import suppress
+
 import click
 
 from code42cli.errors import Code42CLIError
+from code42cli.logger import flush_logger
 from code42cli.logger import get_logger_for_server
 from code42cli.logger.enums import ServerProtocol
 from code42cli.output_formats import OutputFormat
 
+# Number of events coalesced into a single socket write when sending over TCP/TLS.
+SEND_TO_BATCH_SIZE = 100
+
 
-def _try_get_logger_for_server(hostname, protocol, output_format, certs):
+def _try_get_logger_for_server(hostname, protocol, output_format, certs, batch_size=1):
     try:
-        return get_logger_for_server(hostname, protocol, output_format, certs)
+        return get_logger_for_server(
+            hostname, protocol, output_format, certs, batch_size=batch_size
+        )
     except Exception as err:
         raise Code42CLIError(
             f"Unable to connect to {hostname}. Failed with error: {err}."
@@ -27,10 +35,21 @@ class SendToCommand(click.Command):
         if ignore_cert_validation:
             certs = "ignore"
 
+        # checkpoints are stored as each event is handed off, so buffering would let the stored
+        # checkpoint get ahead of what the server has actually received.
+        batch_size = 1 if ctx.params.get("use_checkpoint") else SEND_TO_BATCH_SIZE
         ctx.obj.logger = _try_get_logger_for_server(
-            hostname, protocol, output_format, certs
+            hostname, protocol, output_format, certs, batch_size=batch_size
         )
-        return super().invoke(ctx)
+        try:
+            result = super().invoke(ctx)
+        except BaseException:
+            # Still try to send what was buffered, but without hiding the original error.
+            with suppress(Exception):
+                flush_logger(ctx.obj.logger)
+            raise
+        flush_logger(ctx.obj.logger)
+        return result
 
 
 def _handle_incompatible_args(protocol, ignore_cert_validation, certs):
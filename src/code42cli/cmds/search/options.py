@@ -11,47 +11,57 @@ from code42cli.logger.enums import ServerProtocol
 
 
 def is_in_filter(filter_cls):
+    is_in = filter_cls.is_in
+
     def callback(ctx, param, arg):
         if arg:
-            ctx.obj.search_filters.append(filter_cls.is_in(arg))
+            ctx.obj.search_filters.append(is_in(arg))
         return arg
 
     return callback
 
 
 def not_in_filter(filter_cls):
+    not_in = filter_cls.not_in
+
     def callback(ctx, param, arg):
         if arg:
-            ctx.obj.search_filters.append(filter_cls.not_in(arg))
+            ctx.obj.search_filters.append(not_in(arg))
         return arg
 
     return callback
 
 
 def exists_filter(filter_cls):
+    exists = filter_cls.exists
+
     def callback(ctx, param, arg):
         if not arg:
-            ctx.obj.search_filters.append(filter_cls.exists())
+            ctx.obj.search_filters.append(exists())
             return arg
 
     return callback
 
 
 def contains_filter(filter_cls):
+    contains = filter_cls.contains
+
     def callback(ctx, param, arg):
         if arg:
             for item in arg:
-                ctx.obj.search_filters.append(filter_cls.contains(item))
+                ctx.obj.search_filters.append(contains(item))
         return arg
 
     return callback
 
 
 def not_contains_filter(filter_cls):
+    not_contains = filter_cls.not_contains
+
     def callback(ctx, param, arg):
         if arg:
             for item in arg:
-                ctx.obj.search_filters.append(filter_cls.not_contains(item))
+                ctx.obj.search_filters.append(not_contains(item))
         return arg
 
     return callback
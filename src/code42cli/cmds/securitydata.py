@@ -1,9 +1,9 @@
+from contextlib import closing
 from pprint import pformat
 
 import click
 import py42.sdk.queries.fileevents.filters as f
 from click import echo
-from pandas import DataFrame
 from py42.exceptions import Py42InvalidPageTokenError
 from py42.sdk.queries.fileevents.file_event_query import FileEventQuery
 from py42.sdk.queries.fileevents.filters import InsertionTimestamp
@@ -31,10 +31,14 @@ from code42cli.options import sdk_options
 from code42cli.output_formats import DataFrameOutputFormatter
 from code42cli.output_formats import FileEventsOutputFormat
 from code42cli.output_formats import FileEventsOutputFormatter
+from code42cli.util import iter_in_background
+from code42cli.util import load_response_json
 from code42cli.util import warn_interrupt
 
 logger = get_main_cli_logger()
 MAX_EVENT_PAGE_SIZE = 10000
+FILE_EVENTS_KEY = "fileEvents"
+NEXT_PAGE_TOKEN_KEY = "nextPgToken"
 
 SECURITY_DATA_KEYWORD = "file events"
 file_events_format_option = click.option(
@@ -376,7 +380,7 @@ def search(
         checkpoint = checkpoint_func = None
 
     query = _construct_query(state, begin, end, saved_search, advanced_query, or_query)
-    dfs = _get_all_file_events(state, query, checkpoint)
+    dfs = _get_all_file_events(state.sdk, query, checkpoint)
     formatter = FileEventsOutputFormatter(format, checkpoint_func=checkpoint_func)
     # sending to pager when checkpointing can be inaccurate due to pager buffering, so disallow pager
     force_no_pager = use_checkpoint
@@ -417,13 +421,16 @@ def send_to(
         checkpoint = checkpoint_func = None
 
     query = _construct_query(state, begin, end, saved_search, advanced_query, or_query)
-    dfs = _get_all_file_events(state, query, checkpoint)
+    # fetch the next page while events from the current one are being sent. The sdk is resolved
+    # here so that logging in (and any password or TOTP prompt) happens on the main thread.
+    dfs = iter_in_background(_get_all_file_events(state.sdk, query, checkpoint))
     formatter = FileEventsOutputFormatter(None, checkpoint_func=checkpoint_func)
 
-    with warn_interrupt():
+    log_info = state.logger.info
+    with closing(dfs), warn_interrupt():
         event = None
         for event in formatter.iter_rows(dfs, columns=columns):
-            state.logger.info(event)
+            log_info(event)
         if event is None:  # generator was empty
             click.echo("No results found.")
 
@@ -440,6 +447,8 @@ def saved_search(state):
 @sdk_options()
 def _list(state, format=None):
     """List available saved searches."""
+    from pandas import DataFrame
+
     formatter = DataFrameOutputFormatter(format)
     response = state.sdk.securitydata.savedsearches.get()
     saved_searches_df = DataFrame(response["searches"])
@@ -481,19 +490,29 @@ def _construct_query(state, begin, end, saved_search, advanced_query, or_query):
     return query
 
 
-def _get_all_file_events(state, query, checkpoint=""):
+def _get_all_file_events(sdk, query, checkpoint=""):
     try:
-        response = state.sdk.securitydata.search_all_file_events(
-            query, page_token=checkpoint
-        )
+        response = sdk.securitydata.search_all_file_events(query, page_token=checkpoint)
     except Py42InvalidPageTokenError:
-        response = state.sdk.securitydata.search_all_file_events(query)
-    yield DataFrame(response["fileEvents"])
-    while response["nextPgToken"]:
-        response = state.sdk.securitydata.search_all_file_events(
-            query, page_token=response["nextPgToken"]
+        response = sdk.securitydata.search_all_file_events(query)
+    while True:
+        events, next_page_token = _parse_file_events_page(response)
+        # Release the response before yielding so that its raw body and the rest of the parsed
+        # page are not kept alive while the caller works through the events.
+        del response
+        yield events
+        if not next_page_token:
+            return
+        response = sdk.securitydata.search_all_file_events(
+            query, page_token=next_page_token
         )
-        yield DataFrame(response["fileEvents"])
+
+
+def _parse_file_events_page(response):
+    from pandas import DataFrame
+
+    page = load_response_json(response)
+    return DataFrame(page[FILE_EVENTS_KEY]), page[NEXT_PAGE_TOKEN_KEY]
 
 
 def _handle_timestamp_checkpoint(checkpoint, state):
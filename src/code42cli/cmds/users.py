@@ -1,8 +1,6 @@
 import functools
 
 import click
-from pandas import DataFrame
-from pandas import json_normalize
 from py42.exceptions import Py42NotFoundError
 from py42.exceptions import Py42UserRiskProfileNotFound
 
@@ -118,6 +116,8 @@ def list_users(
 @sdk_options()
 def show_user(state, username, include_legal_hold_membership, format):
     """Show user details."""
+    from pandas import DataFrame
+
     columns = (
         ["userUid", "status", "username", "orgUid", "roles"]
         if format == OutputFormat.TABLE
@@ -794,6 +794,8 @@ def _get_legacy_user_id(sdk, username):
 
 @functools.lru_cache()
 def _get_role_id(sdk, role_name):
+    from pandas import DataFrame
+
     try:
         roles_dataframe = DataFrame.from_records(
             sdk.users.get_available_roles().data, index="roleName"
@@ -805,6 +807,8 @@ def _get_role_id(sdk, role_name):
 
 
 def _get_users_dataframe(sdk, columns, org_uid, role_id, active, include_roles):
+    from pandas import DataFrame
+
     users_generator = sdk.users.get_all(
         active=active, org_uid=org_uid, role_id=role_id, incRoles=include_roles
     )
@@ -816,6 +820,8 @@ def _get_users_dataframe(sdk, columns, org_uid, role_id, active, include_roles):
 
 
 def _add_legal_hold_membership_to_user_dataframe(sdk, df):
+    from pandas import json_normalize
+
     columns = ["legalHold.legalHoldUid", "legalHold.name", "user.userUid"]
 
     custodians = list(_get_all_active_hold_memberships(sdk))
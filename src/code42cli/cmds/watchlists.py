@@ -1,7 +1,6 @@
 import csv
 
 import click
-from pandas import DataFrame
 from py42.constants import WatchlistType
 from py42.exceptions import Py42NotFoundError
 from py42.exceptions import Py42WatchlistNotFound
@@ -29,6 +28,8 @@ def watchlists(state):
 @sdk_options()
 def _list(state, format):
     """List all watchlists."""
+    from pandas import DataFrame
+
     pages = state.sdk.watchlists.get_all()
     dfs = (DataFrame(page["watchlists"]) for page in pages)
     formatter = DataFrameOutputFormatter(format)
@@ -56,6 +57,8 @@ def _list(state, format):
 @sdk_options()
 def list_members(state, watchlist_type, watchlist_id, only_included_users, format):
     """List all members on a given watchlist."""
+    from pandas import DataFrame
+
     if not watchlist_id and not watchlist_type:
         raise click.ClickException("--watchlist-id OR --watchlist-type is required.")
     if watchlist_type:
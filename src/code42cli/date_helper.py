@@ -1,12 +1,12 @@
 import re
-from datetime import datetime
-from datetime import timedelta
+import time
 from datetime import timezone
 
 import click
 
 TIMESTAMP_REGEX = re.compile(r"(\d{4}-\d{2}-\d{2})\s*(.*)?")
 MAGIC_TIME_REGEX = re.compile(r"(\d+)([dhm])$")
+_SECONDS_PER_DAY = 86400
 
 _FORMAT_VALUE_ERROR_MESSAGE = (
     "input must be a date/time string (e.g. 'yyyy-MM-dd', "
@@ -35,8 +35,8 @@ def verify_timestamp_order(
 def limit_date_range(dt, max_days_back=90, param=None):
     if dt is None:
         return
-    now = datetime.utcnow().replace(tzinfo=timezone.utc)
-    if now - dt > timedelta(days=max_days_back):
+    boundary = time.time() - max_days_back * _SECONDS_PER_DAY
+    if dt.timestamp() < boundary:
         raise click.BadParameter(
             message=f"must be within {max_days_back} days.", param=param
         )
@@ -1,6 +1,7 @@
 import logging
 import os
 import traceback
+from functools import lru_cache
 from logging.handlers import RotatingFileHandler
 from threading import Lock
 
@@ -19,13 +20,15 @@ logger_deps_lock = Lock()
 ERROR_LOG_FILE_NAME = "code42_errors.log"
 
 
+_FORMATTERS = {
+    FileEventsOutputFormat.JSON: FileEventDictToJSONFormatter,
+    FileEventsOutputFormat.CEF: FileEventDictToCEFFormatter,
+}
+
+
 def _get_formatter(output_format):
-    if output_format == FileEventsOutputFormat.JSON:
-        return FileEventDictToJSONFormatter()
-    elif output_format == FileEventsOutputFormat.CEF:
-        return FileEventDictToCEFFormatter()
-    else:
-        return FileEventDictToRawJSONFormatter()
+    formatter_class = _FORMATTERS.get(output_format, FileEventDictToRawJSONFormatter)
+    return formatter_class()
 
 
 def _init_logger(logger, handler, output_format):
@@ -34,7 +37,7 @@ def _init_logger(logger, handler, output_format):
     return add_handler_to_logger(logger, handler, formatter)
 
 
-def get_logger_for_server(hostname, protocol, output_format, certs):
+def get_logger_for_server(hostname, protocol, output_format, certs, batch_size=1):
     """Gets the logger that sends logs to a server for the given format.
 
     Args:
@@ -42,22 +45,34 @@ def get_logger_for_server(hostname, protocol, output_format, certs):
         protocol: The transfer protocol for sending logs.
         output_format: CEF, JSON, or RAW_JSON. Each type results in a different logger instance.
         certs: Use for passing SSL/TLS certificates when connecting to the server.
+        batch_size: The number of records to buffer before writing to a TCP/TLS connection.
+            Buffered records are written when the batch fills or `flush_logger()` is called.
+            If the logger already exists, its handler is switched to this batch size.
     """
     logger = logging.getLogger(f"code42_syslog_{output_format.lower()}")
-    if logger_has_handlers(logger):
-        return logger
-
-    with logger_deps_lock:
-        url_parts = get_url_parts(hostname)
-        hostname = url_parts[0]
-        port = url_parts[1] or 514
-        if not logger_has_handlers(logger):
-            handler = NoPrioritySysLogHandler(hostname, port, protocol, certs)
-            handler.connect_socket()
-            return _init_logger(logger, handler, output_format)
+    if not logger_has_handlers(logger):
+        with logger_deps_lock:
+            url_parts = get_url_parts(hostname)
+            hostname = url_parts[0]
+            port = url_parts[1] or 514
+            if not logger_has_handlers(logger):
+                handler = NoPrioritySysLogHandler(
+                    hostname, port, protocol, certs, batch_size=batch_size
+                )
+                handler.connect_socket()
+                return _init_logger(logger, handler, output_format)
+
+    for handler in logger.handlers:
+        handler.set_batch_size(batch_size)
     return logger
 
 
+def flush_logger(logger):
+    """Writes out any records still buffered by the logger's handlers."""
+    for handler in logger.handlers:
+        handler.flush()
+
+
 def _get_standard_formatter():
     return logging.Formatter("%(message)s")
 
@@ -132,5 +147,8 @@ class CliLogger:
             self.log_error(f"Request parameters: {http_request.body}")
 
 
+# Modules fetch this at import time and workers fetch it once each, so share one instance
+# rather than building a new wrapper (and taking the logger lock) on every call.
+@lru_cache(maxsize=None)
 def get_main_cli_logger():
     return CliLogger()
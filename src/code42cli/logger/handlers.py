@@ -6,6 +6,10 @@ from logging.handlers import SysLogHandler
 
 from code42cli.logger.enums import ServerProtocol
 
+# Size requested for the kernel send buffer of TCP/TLS sockets, so bursts of events can be
+# queued without blocking on each `sendall()`.
+_SEND_BUFFER_SIZE = 1 << 20
+
 
 class SyslogServerNetworkConnectionError(Exception):
     """An error raised when the connection is disrupted during logging."""
@@ -27,19 +31,27 @@ class NoPrioritySysLogHandler(SysLogHandler):
     `self.socket` is lazily loaded for testing purposes, so the connection does not get
     made for TCP/TLS until the first log record is about to be transmitted.
 
+    When `batch_size` is greater than 1 and the protocol is TCP or TLS, formatted records are
+    buffered and written to the socket in a single `sendall()` once `batch_size` records have
+    accumulated, or when `flush()` is called. UDP always sends one datagram per record.
+
     Args:
         hostname: The hostname of the syslog server to send log messages to.
         port: The port of the syslog server to send log messages to.
         protocol: The protocol over which to submit syslog messages. Accepts TCP, UDP, or TLS.
         certs: Certs to specify when using TLS-TCP for the `protocol` argument. Use "ignore" for
             ssl.CERT_NONE (ignoring certificate validation).
+        batch_size: The number of records to buffer before writing them to a TCP/TLS socket.
+            Defaults to 1 (no buffering).
     """
 
-    def __init__(self, hostname, port, protocol, certs):
+    def __init__(self, hostname, port, protocol, certs, batch_size=1):
         self._hostname = hostname
         self._port = port
         self._protocol = protocol
         self._certs = certs
+        self._batch_size = batch_size
+        self._buffer = []
         self.address = (hostname, port)
         logging.Handler.__init__(self)
         self.socktype = _try_get_socket_type_from_protocol(protocol)
@@ -60,6 +72,8 @@ class NoPrioritySysLogHandler(SysLogHandler):
         sock = None
         try:
             sock = socket.socket(address_family, sock_type, proto)
+            if sock_type == socket.SOCK_STREAM:
+                _set_stream_socket_options(sock)
             if self._wrap_socket:
                 sock = _wrap_socket_for_ssl(sock, certs, hostname)
             if sock_type == socket.SOCK_STREAM:
@@ -76,12 +90,35 @@ class NoPrioritySysLogHandler(SysLogHandler):
             raise OSError("getaddrinfo() returns an empty list")
         return info[0]
 
+    @property
+    def _is_batching(self):
+        return self._batch_size > 1 and self.socktype == socket.SOCK_STREAM
+
     def emit(self, record):
         try:
-            self._send_record(record)
+            if self._is_batching:
+                self._buffer_record(record)
+            else:
+                self._send_record(record)
         except Exception:
             self.handleError(record)
 
+    def set_batch_size(self, batch_size):
+        """Changes the number of records to buffer, first writing out any already buffered."""
+        self.flush()
+        self._batch_size = batch_size
+
+    def flush(self):
+        """Writes any buffered records to the socket."""
+        self.acquire()
+        try:
+            if self._buffer:
+                self._send_buffer()
+        except ConnectionError:
+            raise SyslogServerNetworkConnectionError()
+        finally:
+            self.release()
+
     def handleError(self, record):
         """Override logger's `handleError` method to exit if an exception is raised while trying to
         log, otherwise it would continue to gather and process events if the connection breaks but send
@@ -92,16 +129,30 @@ class NoPrioritySysLogHandler(SysLogHandler):
             raise SyslogServerNetworkConnectionError()
         super().handleError(record)
 
-    def _send_record(self, record):
+    def _format_message(self, record):
         formatted_record = self.format(record)
         msg = formatted_record + "\n"
-        msg = msg.encode("utf-8")
+        return msg.encode("utf-8")
+
+    def _send_record(self, record):
+        msg = self._format_message(record)
         if self.socktype == socket.SOCK_DGRAM:
             self.socket.sendto(msg, self.address)
         else:
             self.socket.sendall(msg)
 
+    def _buffer_record(self, record):
+        self._buffer.append(self._format_message(record))
+        if len(self._buffer) >= self._batch_size:
+            self._send_buffer()
+
+    def _send_buffer(self):
+        msg = b"".join(self._buffer)
+        self._buffer = []
+        self.socket.sendall(msg)
+
     def close(self):
+        self.flush()
         if self._wrap_socket:
             self.socket.unwrap()
         self.socket.close()
@@ -119,6 +170,12 @@ def _wrap_socket_for_ssl(sock, certs, hostname):
     return context.wrap_socket(sock, server_hostname=hostname)
 
 
+def _set_stream_socket_options(sock):
+    # Disable Nagle's algorithm so records are not held back waiting for more data to coalesce.
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _SEND_BUFFER_SIZE)
+
+
 def _connect_socket(sock, sa):
     sock.settimeout(10)
     sock.connect(sa)
@@ -134,11 +191,15 @@ def _try_get_socket_type_from_protocol(protocol):
     return socket_type
 
 
+_SOCKET_TYPES = {
+    ServerProtocol.TCP: socket.SOCK_STREAM,
+    ServerProtocol.TLS_TCP: socket.SOCK_STREAM,
+    ServerProtocol.UDP: socket.SOCK_DGRAM,
+}
+
+
 def _get_socket_type_from_protocol(protocol):
-    if protocol in [ServerProtocol.TCP, ServerProtocol.TLS_TCP]:
-        return socket.SOCK_STREAM
-    elif protocol == ServerProtocol.UDP:
-        return socket.SOCK_DGRAM
+    return _SOCKET_TYPES.get(protocol)
 
 
 def _raise_socket_type_error(protocol):
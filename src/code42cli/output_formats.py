@@ -2,21 +2,20 @@ import csv
 import io
 import json
 from itertools import chain
+from itertools import islice
 from typing import Generator
 
 import click
-from pandas import concat
-from pandas import notnull
 
 from code42cli.enums import FileEventsOutputFormat
 from code42cli.enums import OutputFormat
 from code42cli.errors import Code42CLIError
 from code42cli.logger.formatters import CEF_TEMPLATE
 from code42cli.logger.formatters import map_event_to_cef
+from code42cli.util import dumps_json
 from code42cli.util import find_format_width
 from code42cli.util import format_to_table
 
-
 CEF_DEFAULT_PRODUCT_NAME = "Advanced Exfiltration Detection"
 CEF_DEFAULT_SEVERITY_LEVEL = "5"
 
@@ -63,6 +62,49 @@ class OutputFormatter:
             if self.output_format in [OutputFormat.TABLE]:
                 click.echo()
 
+    def echo_formatted_iterable(self, output, force_no_pager=False):
+        """Formats and echoes the records of an iterable (e.g. a generator of search results) as
+        they are produced, so that they never all have to be held in memory at once. TABLE and CSV
+        formats need every record to size their columns, so those are collected into a list first.
+
+        Pass `force_no_pager=True` when consuming the iterable has side effects, such as storing
+        checkpoints, that must match what was actually printed.
+
+        Returns `False` if the iterable was empty.
+        """
+        if self._requires_list_output:
+            output_list = list(output)
+            if output_list:
+                self.echo_formatted_list(output_list)
+            return bool(output_list)
+
+        output = iter(output)
+        first_records = list(islice(output, OUTPUT_VIA_PAGER_THRESHOLD + 1))
+        records = chain(first_records, output)
+        if force_no_pager or len(first_records) <= OUTPUT_VIA_PAGER_THRESHOLD:
+            for record in records:
+                click.echo(self._format_output(record), nl=False)
+        else:
+            self._echo_iterable_via_pager(records)
+        return bool(first_records)
+
+    def _echo_iterable_via_pager(self, records):
+        # click's pager silently stops on an `IOError` raised while iterating, which would hide
+        # network errors (requests' errors are `IOError`s) behind truncated output, so errors are
+        # held back from the pager and re-raised once it exits.
+        errors = []
+
+        def formatted_records():
+            try:
+                for record in records:
+                    yield self._format_output(record)
+            except Exception as err:
+                errors.append(err)
+
+        click.echo_via_pager(formatted_records())
+        if errors:
+            raise errors[0]
+
     @property
     def _requires_list_output(self):
         return self.output_format in (OutputFormat.TABLE, OutputFormat.CSV)
@@ -85,6 +127,8 @@ class DataFrameOutputFormatter:
         return dfs
 
     def _iter_table(self, dfs, columns=None, **kwargs):
+        from pandas import concat
+
         dfs = self._ensure_iterable(dfs)
         df = concat(dfs)
         if df.empty:
@@ -137,6 +181,11 @@ class DataFrameOutputFormatter:
             json_string = json.dumps(event, **kwargs)
             yield f"{json_string}\n"
 
+    def _iter_raw_json(self, dfs, columns=None):
+        # Serialized the same way as `OutputFormatter`'s RAW-JSON output.
+        for event in self.iter_rows(dfs, columns=columns):
+            yield to_json(event)
+
     def _checkpoint_and_iter_formatted_events(self, df, formatted_rows):
         for event, row in zip(df.to_dict("records"), formatted_rows):
             yield row
@@ -180,6 +229,8 @@ class DataFrameOutputFormatter:
         Accepts an optional list of column names that filter
         columns in the yielded results.
         """
+        from pandas import notnull
+
         dfs = self._ensure_iterable(dfs)
         for df in dfs:
             # convert pandas' default null (numpy.NaN) to None
@@ -216,7 +267,7 @@ class DataFrameOutputFormatter:
             yield from self._iter_json(dfs, columns=columns, **kwargs)
 
         elif self.output_format == OutputFormat.RAW:
-            yield from self._iter_json(dfs, columns=columns, **kwargs)
+            yield from self._iter_raw_json(dfs, columns=columns)
 
         else:
             raise Code42CLIError(
@@ -309,7 +360,7 @@ def to_table(output, header, include_header=True):
 
 def to_json(output):
     """Output is a single record"""
-    return f"{json.dumps(output)}\n"
+    return f"{dumps_json(output)}\n"
 
 
 def to_formatted_json(output):
@@ -1,7 +1,6 @@
+from functools import lru_cache
 from getpass import getpass
 
-import keyring
-
 from code42cli import PRODUCT_NAME
 from code42cli.util import does_user_agree
 
@@ -9,7 +8,7 @@ from code42cli.util import does_user_agree
 def get_stored_password(profile):
     """Gets your currently stored password for the given profile."""
     service_name = _get_keyring_service_name(profile.name)
-    return keyring.get_password(service_name, profile.username)
+    return _get_keyring_password(service_name, profile.username)
 
 
 def get_password_from_prompt():
@@ -19,18 +18,33 @@ def get_password_from_prompt():
 
 def set_password(profile, new_password):
     """Sets your password for the given profile."""
+    import keyring
+
     service_name = _get_keyring_service_name(profile.name)
     uses_file_storage = keyring.get_keyring().priority < 1
     if uses_file_storage and not _prompt_for_alternative_store():
         return
 
     keyring.set_password(service_name, profile.username, new_password)
+    _get_keyring_password.cache_clear()
 
 
 def delete_password(profile):
     """Deletes password for the given profile."""
+    import keyring
+
     service_name = _get_keyring_service_name(profile.name)
     keyring.delete_password(service_name, profile.username)
+    _get_keyring_password.cache_clear()
+
+
+@lru_cache(maxsize=8)
+def _get_keyring_password(service_name, username):
+    # keyring backends can be slow (e.g. a D-Bus call to the Secret Service), and the same
+    # password is often looked up several times in one process, such as from the shell.
+    import keyring
+
+    return keyring.get_password(service_name, username)
 
 
 def _get_keyring_service_name(profile_name):
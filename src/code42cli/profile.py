@@ -26,7 +26,8 @@ class Code42Profile:
 
     @property
     def ignore_ssl_errors(self):
-        return self._profile[ConfigAccessor.IGNORE_SSL_ERRORS_KEY]
+        # The config file stores this as the string "True" or "False".
+        return self._profile[ConfigAccessor.IGNORE_SSL_ERRORS_KEY] == "True"
 
     @property
     def has_stored_password(self):
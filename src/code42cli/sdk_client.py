@@ -5,6 +5,7 @@ import requests
 from click import prompt
 from click import secho
 from py42.exceptions import Py42UnauthorizedError
+from requests.adapters import HTTPAdapter
 from requests.exceptions import ConnectionError
 from requests.exceptions import SSLError
 
@@ -15,13 +16,20 @@ from code42cli.logger import get_main_cli_logger
 
 py42.settings.items_per_page = 500
 
+# py42's shared session keeps at most 4 connections per host and blocks when all are in use,
+# which would leave one of the bulk commands' 5 worker threads waiting on every request.
+HTTP_POOL_MAXSIZE = 16
+_http_adapter = HTTPAdapter(
+    pool_connections=200, pool_maxsize=HTTP_POOL_MAXSIZE, pool_block=True
+)
+
 logger = get_main_cli_logger()
 
 
 def create_sdk(profile, is_debug_mode, password=None, totp=None):
     if is_debug_mode:
         py42.settings.debug.level = debug.DEBUG
-    if profile.ignore_ssl_errors == "True":
+    if profile.ignore_ssl_errors:
         secho(
             f"Warning: Profile '{profile.name}' has SSL verification disabled. "
             "Adding certificate verification is strongly advised.",
@@ -33,9 +41,21 @@ def create_sdk(profile, is_debug_mode, password=None, totp=None):
         )
         py42.settings.verify_ssl_certs = False
     password = password or profile.get_password()
+    _expand_connection_pool()
     return _validate_connection(profile.authority_url, profile.username, password, totp)
 
 
+def _expand_connection_pool():
+    # py42 does not expose its session, so leave its defaults alone if the internals change.
+    try:
+        from py42.services._connection import ROOT_SESSION
+    except ImportError:
+        return
+    if ROOT_SESSION.get_adapter("https://") is not _http_adapter:
+        ROOT_SESSION.mount("https://", _http_adapter)
+        ROOT_SESSION.mount("http://", _http_adapter)
+
+
 def _validate_connection(authority_url, username, password, totp=None):
     try:
         return py42.sdk.from_local_account(authority_url, username, password, totp=totp)
@@ -2,18 +2,28 @@ import json
 import os
 import shutil
 from datetime import timezone
+from functools import lru_cache
 from functools import wraps
 from hashlib import md5
 from os import path
+from queue import Full
+from queue import Queue
 from signal import getsignal
 from signal import SIGINT
 from signal import signal
+from threading import Event
+from threading import Thread
 
 import dateutil.parser
 from click import echo
 from click import get_current_context
 from click import style
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 _PADDING_SIZE = 3
 
 
@@ -152,6 +162,54 @@ class warn_interrupt:
         return inner
 
 
+_BACKGROUND_ITER_DONE = object()
+# How long the producer thread waits on a full queue before checking whether the consumer stopped.
+_BACKGROUND_ITER_PUT_TIMEOUT = 0.5
+
+
+def iter_in_background(iterable, maxsize=2):
+    """Iterates `iterable` on a separate thread, buffering up to `maxsize` items ahead of the
+    caller. Use to overlap fetching the next page of results from the server with processing
+    of the current one. Exceptions raised while iterating are re-raised in the caller's thread.
+
+    The producer thread stops once the returned generator is closed, so close it (e.g. with
+    `contextlib.closing`) if the caller may stop consuming before the iterable is exhausted.
+    """
+    queue = Queue(maxsize=maxsize)
+    stopped = Event()
+
+    def put(entry):
+        while not stopped.is_set():
+            try:
+                queue.put(entry, timeout=_BACKGROUND_ITER_PUT_TIMEOUT)
+                return True
+            except Full:
+                pass
+        return False
+
+    def produce():
+        err = None
+        try:
+            for item in iterable:
+                if not put((item, None)):
+                    return
+        except BaseException as ex:
+            err = ex
+        put((_BACKGROUND_ITER_DONE, err))
+
+    Thread(target=produce, daemon=True).start()
+    try:
+        while True:
+            item, err = queue.get()
+            if err is not None:
+                raise err
+            if item is _BACKGROUND_ITER_DONE:
+                return
+            yield item
+    finally:
+        stopped.set()
+
+
 def get_url_parts(url_str):
     parts = url_str.split(":")
     port = None
@@ -193,6 +251,8 @@ def print_numbered_list(items):
     echo()
 
 
+# checkpointing parses the timestamp of every event, and consecutive events often share one.
+@lru_cache(maxsize=64)
 def parse_timestamp(date_str):
     # example: {"property": "bar", "timestamp": "2020-11-23T17:13:26.239647Z"}
     ts = date_str[:-1]
@@ -200,5 +260,39 @@ def parse_timestamp(date_str):
     return date.timestamp()
 
 
+def load_response_json(response):
+    """Parses the JSON body of a py42 response directly from its raw bytes. Uses `orjson` when it
+    is installed, which is considerably faster than the stdlib `json` module on large pages of
+    events, and skips the extra decode to `str` that `response.text` incurs."""
+    if orjson is not None:
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            # orjson rejects some input the json module accepts, such as lone surrogate escapes
+            # (e.g. "\ud800") that can occur in Windows file names.
+            pass
+    return json.loads(response.content)
+
+
+def dumps_json(obj):
+    """Serializes `obj` to a compact JSON string, leaving non-ASCII characters unescaped and
+    converting non-string keys to strings. Uses `orjson` when it is installed.
+
+    Values that cannot be written as UTF-8 (lone surrogates, e.g. from Windows file names) or
+    that `orjson` does not support (integers wider than 64 bits) fall back to `json.dumps()`
+    with its default ASCII escaping."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            return json.dumps(obj)
+    json_string = json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+    try:
+        json_string.encode("utf-8")
+    except UnicodeEncodeError:
+        return json.dumps(obj)
+    return json_string
+
+
 def deprecation_warning(text):
     echo(style(text, fg="red"), err=True)
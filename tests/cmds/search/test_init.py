@@ -1,9 +1,12 @@
+import click
 import pytest
 
 from code42cli.cmds.search import _try_get_logger_for_server
+from code42cli.cmds.search import SendToCommand
 from code42cli.enums import SendToFileEventsOutputFormat
 from code42cli.errors import Code42CLIError
 from code42cli.logger.enums import ServerProtocol
+from code42cli.logger.handlers import SyslogServerNetworkConnectionError
 
 
 _TEST_ERROR_MESSAGE = "TEST ERROR MESSAGE"
@@ -16,6 +19,12 @@ def patched_get_logger_method(mocker):
     return mocker.patch("code42cli.cmds.search.get_logger_for_server")
 
 
+@pytest.fixture
+def patched_flush_logger(mocker):
+    mocker.patch("code42cli.cmds.search._try_get_logger_for_server")
+    return mocker.patch("code42cli.cmds.search.flush_logger")
+
+
 @pytest.fixture
 def errored_logger(patched_get_logger_method):
     patched_get_logger_method.side_effect = Exception(_TEST_ERROR_MESSAGE)
@@ -35,6 +44,7 @@ def test_try_get_logger_for_server_calls_get_logger_for_server(
         ServerProtocol.TLS_TCP,
         SendToFileEventsOutputFormat.CEF,
         _TEST_CERTS,
+        batch_size=1,
     )
 
 
@@ -53,3 +63,27 @@ def test_try_get_logger_for_server_when_exception_raised_raises_code42_cli_error
         str(err.value)
         == f"Unable to connect to example.com. Failed with error: {_TEST_ERROR_MESSAGE}."
     )
+
+
+def test_send_to_command_flushes_logger_after_command_completes(
+    mocker, patched_flush_logger
+):
+    @click.command(cls=SendToCommand)
+    def cmd():
+        pass
+
+    cmd.main([], obj=mocker.MagicMock(), standalone_mode=False)
+    assert patched_flush_logger.call_count == 1
+
+
+def test_send_to_command_when_command_and_flush_fail_raises_command_error(
+    mocker, patched_flush_logger
+):
+    patched_flush_logger.side_effect = SyslogServerNetworkConnectionError()
+
+    @click.command(cls=SendToCommand)
+    def cmd():
+        raise ValueError(_TEST_ERROR_MESSAGE)
+
+    with pytest.raises(ValueError):
+        cmd.main([], obj=mocker.MagicMock(), standalone_mode=False)
@@ -11,6 +11,8 @@ from tests.conftest import create_mock_response
 from tests.conftest import get_test_date_str
 
 from code42cli import PRODUCT_NAME
+from code42cli.cmds.alerts import _get_alert_cursor_store
+from code42cli.cmds.search import SEND_TO_BATCH_SIZE
 from code42cli.cmds.search.cursor_store import AlertCursorStore
 from code42cli.logger.enums import ServerProtocol
 from code42cli.main import cli
@@ -706,6 +708,24 @@ def test_search_and_send_to_with_use_checkpoint_and_with_begin_and_without_check
     assert begin_option.expected_timestamp == actual_begin
 
 
+def test_search_with_use_checkpoint_does_not_use_pager(
+    mocker,
+    cli_state,
+    alert_cursor_without_checkpoint,
+    runner,
+    search_all_alerts_success,
+):
+    echo_iterable = mocker.patch(
+        "code42cli.output_formats.OutputFormatter.echo_formatted_iterable"
+    )
+    runner.invoke(
+        cli,
+        ["alerts", "search", "--use-checkpoint", "test", "--begin", "1d"],
+        obj=cli_state,
+    )
+    assert echo_iterable.call_args[1]["force_no_pager"]
+
+
 @search_and_send_to_test
 def test_search_and_send_to_with_use_checkpoint_and_with_begin_and_with_stored_checkpoint_calls_search_all_alerts_with_checkpoint_and_ignores_begin_arg(
     cli_state, alert_cursor_with_checkpoint, runner, command, search_all_alerts_success
@@ -1004,7 +1024,7 @@ def test_send_to_creates_expected_logger(cli_state, runner, send_to_logger_facto
         obj=cli_state,
     )
     send_to_logger_factory.assert_called_once_with(
-        "0.0.0.0", "TLS-TCP", "RAW-JSON", "certs/file"
+        "0.0.0.0", "TLS-TCP", "RAW-JSON", "certs/file", batch_size=SEND_TO_BATCH_SIZE
     )
 
 
@@ -1026,7 +1046,28 @@ def test_send_to_when_given_ignore_cert_validation_uses_certs_equal_to_ignore_st
         obj=cli_state,
     )
     send_to_logger_factory.assert_called_once_with(
-        "0.0.0.0", "TLS-TCP", "RAW-JSON", "ignore"
+        "0.0.0.0", "TLS-TCP", "RAW-JSON", "ignore", batch_size=SEND_TO_BATCH_SIZE
+    )
+
+
+def test_send_to_when_given_use_checkpoint_creates_logger_without_batching(
+    cli_state, runner, send_to_logger_factory, alert_cursor_without_checkpoint
+):
+    runner.invoke(
+        cli,
+        [
+            "alerts",
+            "send-to",
+            "0.0.0.0",
+            "--begin",
+            "1d",
+            "--use-checkpoint",
+            "test",
+        ],
+        obj=cli_state,
+    )
+    send_to_logger_factory.assert_called_once_with(
+        "0.0.0.0", "UDP", "RAW-JSON", None, batch_size=1
     )
 
 
@@ -1233,3 +1274,10 @@ def test_bulk_update_uses_expected_arguments(runner, mocker, cli_state_with_user
         {"id": "1", "state": "PENDING", "note": "note1"},
         {"id": "2", "state": "IN_PROGRESS", "note": "note2"},
     ]
+
+
+def test_get_alert_cursor_store_returns_same_store_for_same_profile():
+    assert _get_alert_cursor_store("profile_a") is _get_alert_cursor_store("profile_a")
+    assert _get_alert_cursor_store("profile_a") is not _get_alert_cursor_store(
+        "profile_b"
+    )
@@ -8,6 +8,7 @@ from tests.cmds.conftest import get_mark_for_search_and_send_to
 from tests.conftest import create_mock_response
 
 from code42cli.click_ext.types import MagicDate
+from code42cli.cmds.search import SEND_TO_BATCH_SIZE
 from code42cli.cmds.search.cursor_store import AuditLogCursorStore
 from code42cli.date_helper import convert_datetime_to_timestamp
 from code42cli.date_helper import round_datetime_to_day_end
@@ -294,6 +295,25 @@ def test_send_to_makes_expected_call_count_to_the_logger_method(
     assert send_to_logger.info.call_count == 4
 
 
+def test_send_to_when_last_page_is_missing_events_key_logs_events_from_earlier_pages(
+    mocker, cli_state, runner, send_to_logger
+):
+    response = create_mock_response(
+        mocker, data={"events": TEST_EVENTS_WITH_DIFFERENT_TIMESTAMPS}
+    )
+
+    def response_gen():
+        yield response
+        raise KeyError("events")
+
+    cli_state.sdk.auditlogs.get_all.return_value = response_gen()
+    runner.invoke(
+        cli, ["audit-logs", "send-to", "localhost", "--begin", "1d"], obj=cli_state
+    )
+    logged_events = [call[0][0] for call in send_to_logger.info.call_args_list]
+    assert logged_events == TEST_EVENTS_WITH_DIFFERENT_TIMESTAMPS
+
+
 def test_send_to_creates_expected_logger(cli_state, runner, send_to_logger_factory):
     runner.invoke(
         cli,
@@ -311,7 +331,7 @@ def test_send_to_creates_expected_logger(cli_state, runner, send_to_logger_facto
         obj=cli_state,
     )
     send_to_logger_factory.assert_called_once_with(
-        "0.0.0.0", "TLS-TCP", "RAW-JSON", "certs/file"
+        "0.0.0.0", "TLS-TCP", "RAW-JSON", "certs/file", batch_size=SEND_TO_BATCH_SIZE
     )
 
 
@@ -333,7 +353,7 @@ def test_send_to_when_given_ignore_cert_validation_uses_certs_equal_to_ignore_st
         obj=cli_state,
     )
     send_to_logger_factory.assert_called_once_with(
-        "0.0.0.0", "TLS-TCP", "RAW-JSON", "ignore"
+        "0.0.0.0", "TLS-TCP", "RAW-JSON", "ignore", batch_size=SEND_TO_BATCH_SIZE
     )
 
 
@@ -12,6 +12,7 @@ from tests.cmds.conftest import get_mark_for_search_and_send_to
 from tests.conftest import create_mock_response
 from tests.conftest import get_test_date_str
 
+from code42cli.cmds.search import SEND_TO_BATCH_SIZE
 from code42cli.cmds.search.cursor_store import FileEventCursorStore
 from code42cli.logger.enums import ServerProtocol
 from code42cli.main import cli
@@ -260,6 +261,30 @@ def test_search_and_send_to_passes_query_object_when_searching_file_events(
     assert isinstance(query, FileEventQuery)
 
 
+@search_and_send_to_test
+def test_search_and_send_to_when_response_has_next_page_token_requests_next_page(
+    mocker, runner, cli_state, command
+):
+    first_page = create_mock_response(
+        mocker,
+        data=json.dumps({"fileEvents": TEST_EVENTS, "nextPgToken": "next-token"}),
+    )
+    last_page = create_mock_response(
+        mocker, data=json.dumps({"fileEvents": TEST_EVENTS, "nextPgToken": ""})
+    )
+    cli_state.sdk.securitydata.search_all_file_events.side_effect = [
+        first_page,
+        last_page,
+    ]
+    runner.invoke(
+        cli, [*command, "--advanced-query", ADVANCED_QUERY_JSON], obj=cli_state
+    )
+
+    search = cli_state.sdk.securitydata.search_all_file_events
+    assert search.call_count == 2
+    assert search.call_args[1]["page_token"] == "next-token"
+
+
 @search_and_send_to_test
 def test_search_and_send_to_when_advanced_query_passed_as_json_string_builds_expected_query(
     runner, cli_state, command, search_all_file_events_success
@@ -1325,7 +1350,7 @@ def test_send_to_creates_expected_logger(
         obj=cli_state,
     )
     send_to_logger_factory.assert_called_once_with(
-        "0.0.0.0", "TLS-TCP", "RAW-JSON", "certs/file"
+        "0.0.0.0", "TLS-TCP", "RAW-JSON", "certs/file", batch_size=SEND_TO_BATCH_SIZE
     )
 
 
@@ -1347,7 +1372,7 @@ def test_send_to_when_given_ignore_cert_validation_uses_certs_equal_to_ignore_st
         obj=cli_state,
     )
     send_to_logger_factory.assert_called_once_with(
-        "0.0.0.0", "TLS-TCP", "RAW-JSON", "ignore"
+        "0.0.0.0", "TLS-TCP", "RAW-JSON", "ignore", batch_size=SEND_TO_BATCH_SIZE
     )
 
 
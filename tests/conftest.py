@@ -10,8 +10,10 @@ from requests import HTTPError
 from requests import Response
 
 import code42cli.errors as error_tracker
+from code42cli.cmds.alerts import _get_alert_cursor_store
 from code42cli.config import ConfigAccessor
 from code42cli.options import CLIState
+from code42cli.password import _get_keyring_password
 from code42cli.profile import Code42Profile
 
 TEST_ID = "TEST_ID"
@@ -27,6 +29,13 @@ def io_prevention(monkeypatch):
     monkeypatch.setattr("logging.FileHandler._open", lambda *args, **kwargs: None)
 
 
+@pytest.fixture(autouse=True)
+def clear_caches():
+    yield
+    _get_keyring_password.cache_clear()
+    _get_alert_cursor_store.cache_clear()
+
+
 @pytest.fixture
 def file_event_namespace():
     args = dict(
@@ -90,7 +99,7 @@ def create_profile_values_dict(authority=None, username=None, ignore_ssl=False):
     return {
         ConfigAccessor.AUTHORITY_KEY: "example.com",
         ConfigAccessor.USERNAME_KEY: "foo",
-        ConfigAccessor.IGNORE_SSL_ERRORS_KEY: True,
+        ConfigAccessor.IGNORE_SSL_ERRORS_KEY: "True",
     }
 
 
@@ -295,6 +304,7 @@ def create_mock_response(mocker, data=None, status=200):
         data = ""
     response = mocker.MagicMock(spec=Response)
     response.text = data
+    response.content = data.encode() if isinstance(data, str) else data
     response.status_code = status
     response.encoding = None
     response._content_consumed = ""
@@ -526,6 +526,17 @@ class TestFileEventDictToRawJSONFormatter:
             file_event_dict["actor"] is None
         )  # actor happens to be null in this case.
 
+    def test_format_when_value_not_utf8_encodable_returns_escaped_json(
+        self, mock_file_event_log_record
+    ):
+        mock_file_event_log_record.msg = {
+            **mock_file_event_log_record.msg,
+            "fileName": "bad\ud800name.txt",
+        }
+        json_out = FileEventDictToRawJSONFormatter().format(mock_file_event_log_record)
+        json_out.encode("utf-8")
+        assert json.loads(json_out)["fileName"] == "bad\ud800name.txt"
+
 
 def get_cef_parts(cef_str):
     return cef_str.split("|")
@@ -1,10 +1,13 @@
 import ssl
 from socket import IPPROTO_TCP
 from socket import IPPROTO_UDP
+from socket import SO_SNDBUF
 from socket import SOCK_DGRAM
 from socket import SOCK_STREAM
 from socket import socket
 from socket import SocketKind
+from socket import SOL_SOCKET
+from socket import TCP_NODELAY
 
 import pytest
 
@@ -143,6 +146,23 @@ class TestNoPrioritySysLogHandler:
         assert call_args[3] == IPPROTO_TCP
         assert socket_mocks.mock_socket.connect.call_count == 1
 
+    @tls_and_tcp_test
+    def test_connect_socket_when_tcp_or_tls_sets_nodelay_and_send_buffer_size(
+        self, socket_mocks, protocol
+    ):
+        handler = NoPrioritySysLogHandler(_TEST_HOST, _TEST_PORT, protocol, None)
+        handler.connect_socket()
+        setsockopt = socket_mocks.mock_socket.setsockopt
+        setsockopt.assert_any_call(IPPROTO_TCP, TCP_NODELAY, 1)
+        setsockopt.assert_any_call(SOL_SOCKET, SO_SNDBUF, 1 << 20)
+
+    def test_connect_socket_when_udp_does_not_set_socket_options(self, socket_mocks):
+        handler = NoPrioritySysLogHandler(
+            _TEST_HOST, _TEST_PORT, ServerProtocol.UDP, None
+        )
+        handler.connect_socket()
+        assert not socket_mocks.mock_socket.setsockopt.call_count
+
     def test_connect_when_tls_calls_create_default_context(self, socket_mocks):
         handler = NoPrioritySysLogHandler(
             _TEST_HOST, _TEST_PORT, ServerProtocol.TLS_TCP, "certs"
@@ -214,6 +234,80 @@ class TestNoPrioritySysLogHandler:
             expected_message, (_TEST_HOST, _TEST_PORT)
         )
 
+    @tls_and_tcp_test
+    def test_emit_when_batching_tcp_sends_buffered_records_in_one_sendall(
+        self, mock_file_event_log_record, protocol
+    ):
+        handler = NoPrioritySysLogHandler(
+            _TEST_HOST, _TEST_PORT, protocol, None, batch_size=2
+        )
+        handler.connect_socket()
+        formatter = FileEventDictToRawJSONFormatter()
+        handler.setFormatter(formatter)
+        handler.emit(mock_file_event_log_record)
+        assert not handler.socket.sendall.call_count
+        handler.emit(mock_file_event_log_record)
+        expected_message = (formatter.format(mock_file_event_log_record) + "\n").encode(
+            "utf-8"
+        )
+        handler.socket.sendall.assert_called_once_with(expected_message * 2)
+
+    @tls_and_tcp_test
+    def test_flush_when_batching_tcp_sends_partial_batch(
+        self, mock_file_event_log_record, protocol
+    ):
+        handler = NoPrioritySysLogHandler(
+            _TEST_HOST, _TEST_PORT, protocol, None, batch_size=10
+        )
+        handler.connect_socket()
+        formatter = FileEventDictToRawJSONFormatter()
+        handler.setFormatter(formatter)
+        handler.emit(mock_file_event_log_record)
+        handler.flush()
+        handler.flush()
+        expected_message = (formatter.format(mock_file_event_log_record) + "\n").encode(
+            "utf-8"
+        )
+        handler.socket.sendall.assert_called_once_with(expected_message)
+
+    @tls_and_tcp_test
+    def test_set_batch_size_sends_buffered_records_and_stops_batching(
+        self, mock_file_event_log_record, protocol
+    ):
+        handler = NoPrioritySysLogHandler(
+            _TEST_HOST, _TEST_PORT, protocol, None, batch_size=10
+        )
+        handler.connect_socket()
+        handler.setFormatter(FileEventDictToRawJSONFormatter())
+        handler.emit(mock_file_event_log_record)
+        handler.set_batch_size(1)
+        assert handler.socket.sendall.call_count == 1
+        handler.emit(mock_file_event_log_record)
+        assert handler.socket.sendall.call_count == 2
+
+    def test_emit_when_batching_udp_sends_each_record(self, mock_file_event_log_record):
+        handler = NoPrioritySysLogHandler(
+            _TEST_HOST, _TEST_PORT, ServerProtocol.UDP, None, batch_size=10
+        )
+        handler.connect_socket()
+        handler.setFormatter(FileEventDictToRawJSONFormatter())
+        handler.emit(mock_file_event_log_record)
+        handler.emit(mock_file_event_log_record)
+        assert handler.socket.sendto.call_count == 2
+
+    def test_flush_when_connection_error_occurs_raises_expected_error(
+        self, mock_file_event_log_record
+    ):
+        handler = NoPrioritySysLogHandler(
+            _TEST_HOST, _TEST_PORT, ServerProtocol.TCP, None, batch_size=10
+        )
+        handler.connect_socket()
+        handler.setFormatter(FileEventDictToRawJSONFormatter())
+        handler.emit(mock_file_event_log_record)
+        handler.socket.sendall.side_effect = ConnectionResetError()
+        with pytest.raises(SyslogServerNetworkConnectionError):
+            handler.flush()
+
     def test_handle_error_when_broken_pipe_error_occurs_raises_expected_error(
         self, mock_file_event_log_record, broken_pipe_error
     ):
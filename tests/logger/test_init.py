@@ -9,7 +9,9 @@ from code42cli.enums import OutputFormat
 from code42cli.enums import SendToFileEventsOutputFormat
 from code42cli.logger import add_handler_to_logger
 from code42cli.logger import CliLogger
+from code42cli.logger import flush_logger
 from code42cli.logger import get_logger_for_server
+from code42cli.logger import get_main_cli_logger
 from code42cli.logger import get_view_error_details_message
 from code42cli.logger import logger_has_handlers
 from code42cli.logger.enums import ServerProtocol
@@ -28,12 +30,7 @@ def init_socket_mock(mocker):
 @pytest.fixture(autouse=True)
 def fresh_syslog_handler(init_socket_mock):
     # Set handlers to empty list so it gets initialized each test
-    get_logger_for_server(
-        "example.com",
-        ServerProtocol.TCP,
-        SendToFileEventsOutputFormat.CEF,
-        None,
-    ).handlers = []
+    logging.getLogger("code42_syslog_cef").handlers = []
     init_socket_mock.call_count = 0
 
 
@@ -122,7 +119,7 @@ def test_get_logger_for_server_constructs_handler_with_expected_args(
         "example.com", ServerProtocol.TCP, SendToFileEventsOutputFormat.CEF, "cert"
     )
     no_priority_syslog_handler.assert_called_once_with(
-        "example.com", 514, ServerProtocol.TCP, "cert"
+        "example.com", 514, ServerProtocol.TCP, "cert", batch_size=1
     )
 
 
@@ -141,7 +138,48 @@ def test_get_logger_for_server_when_hostname_includes_port_constructs_handler_wi
         999,
         ServerProtocol.TCP,
         None,
+        batch_size=1,
+    )
+
+
+def test_get_logger_for_server_passes_batch_size_to_handler(mocker):
+    no_priority_syslog_handler = mocker.patch(
+        "code42cli.logger.handlers.NoPrioritySysLogHandler.__init__"
+    )
+    no_priority_syslog_handler.return_value = None
+    get_logger_for_server(
+        "example.com",
+        ServerProtocol.TCP,
+        SendToFileEventsOutputFormat.CEF,
+        None,
+        batch_size=100,
+    )
+    no_priority_syslog_handler.assert_called_once_with(
+        "example.com", 514, ServerProtocol.TCP, None, batch_size=100
+    )
+
+
+def test_get_logger_for_server_when_logger_exists_sets_batch_size_on_handler(mocker):
+    get_logger_for_server(
+        "example.com",
+        ServerProtocol.TCP,
+        SendToFileEventsOutputFormat.CEF,
+        None,
+        batch_size=100,
+    )
+    set_batch_size = mocker.patch.object(NoPrioritySysLogHandler, "set_batch_size")
+    get_logger_for_server(
+        "example.com", ServerProtocol.TCP, SendToFileEventsOutputFormat.CEF, None
     )
+    set_batch_size.assert_called_once_with(1)
+
+
+def test_flush_logger_flushes_each_handler(mocker):
+    logger = logging.getLogger("test_flush_logger")
+    handler = mocker.MagicMock(spec=logging.Handler)
+    logger.handlers = [handler]
+    flush_logger(logger)
+    assert handler.flush.call_count == 1
 
 
 def test_get_logger_for_server_inits_socket(init_socket_mock):
@@ -172,3 +210,7 @@ class TestCliLogger:
             CliLogger().log_verbose_error("code42 dothing --flag YES", request)
             assert "'code42 dothing --flag YES'" in caplog.text
             assert "Request parameters: {'foo': 'bar'}" in caplog.text
+
+
+def test_get_main_cli_logger_returns_same_instance_each_call():
+    assert get_main_cli_logger() is get_main_cli_logger()
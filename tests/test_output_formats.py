@@ -264,7 +264,22 @@ def test_to_table_when_not_given_header_creates_header_dynamically():
 
 def test_to_json():
     formatted_output = output_formats_module.to_json(TEST_DATA)
-    assert formatted_output == f"{json.dumps(TEST_DATA)}\n"
+    assert formatted_output.endswith("\n")
+    assert json.loads(formatted_output) == TEST_DATA
+
+
+def test_to_json_handles_non_string_keys():
+    formatted_output = output_formats_module.to_json({1: "one"})
+    assert json.loads(formatted_output) == {"1": "one"}
+
+
+@pytest.mark.parametrize(
+    "output", ({"fileName": "bad\ud800name.txt"}, {"size": 2**70})
+)
+def test_to_json_when_value_not_supported_by_orjson_returns_escaped_json(output):
+    formatted_output = output_formats_module.to_json(output)
+    formatted_output.encode("utf-8")
+    assert json.loads(formatted_output) == output
 
 
 def test_to_formatted_json():
@@ -317,6 +332,79 @@ class TestOutputFormatter:
             pass
         mock_to_table.assert_called_once_with("TEST", None, include_header=True)
 
+    def test_echo_formatted_iterable_when_json_does_not_materialize_generator(
+        self, mocker
+    ):
+        mocker.patch("click.echo")
+        mock_pager = mocker.patch("click.echo_via_pager")
+        consumed = []
+
+        def gen():
+            for i in range(output_formats_module.OUTPUT_VIA_PAGER_THRESHOLD + 5):
+                consumed.append(i)
+                yield {"id": i}
+
+        formatter = output_formats_module.OutputFormatter(OutputFormat.RAW)
+        assert formatter.echo_formatted_iterable(gen())
+        assert len(consumed) == output_formats_module.OUTPUT_VIA_PAGER_THRESHOLD + 1
+        lines = list(mock_pager.call_args[0][0])
+        assert len(lines) == output_formats_module.OUTPUT_VIA_PAGER_THRESHOLD + 5
+        assert json.loads(lines[0]) == {"id": 0}
+
+    @pytest.mark.parametrize("fmt", OutputFormat.choices())
+    def test_echo_formatted_iterable_when_few_records_echoes_without_pager(
+        self, mocker, fmt
+    ):
+        mock_echo = mocker.patch("click.echo")
+        mock_pager = mocker.patch("click.echo_via_pager")
+        formatter = output_formats_module.OutputFormatter(fmt, TEST_HEADER)
+        assert formatter.echo_formatted_iterable(iter(TEST_DATA))
+        assert mock_echo.call_count
+        assert not mock_pager.call_count
+
+    def test_echo_formatted_iterable_when_force_no_pager_echoes_without_pager(
+        self, mocker
+    ):
+        mock_echo = mocker.patch("click.echo")
+        mock_pager = mocker.patch("click.echo_via_pager")
+        records = [
+            {"id": i}
+            for i in range(output_formats_module.OUTPUT_VIA_PAGER_THRESHOLD + 5)
+        ]
+        formatter = output_formats_module.OutputFormatter(OutputFormat.RAW)
+        assert formatter.echo_formatted_iterable(iter(records), force_no_pager=True)
+        assert mock_echo.call_count == len(records)
+        assert not mock_pager.call_count
+
+    def test_echo_formatted_iterable_when_error_occurs_while_paging_raises_error(
+        self, mocker
+    ):
+        def swallow_io_errors(gen):
+            # mimics click's pager, which stops on `IOError` raised while iterating
+            try:
+                for _ in gen:
+                    pass
+            except OSError:
+                pass
+
+        mocker.patch("click.echo_via_pager", side_effect=swallow_io_errors)
+
+        def gen():
+            for i in range(output_formats_module.OUTPUT_VIA_PAGER_THRESHOLD + 5):
+                yield {"id": i}
+            raise ConnectionError()
+
+        formatter = output_formats_module.OutputFormatter(OutputFormat.RAW)
+        with pytest.raises(ConnectionError):
+            formatter.echo_formatted_iterable(gen())
+
+    @pytest.mark.parametrize("fmt", OutputFormat.choices())
+    def test_echo_formatted_iterable_when_empty_returns_false(self, mocker, fmt):
+        mock_echo = mocker.patch("click.echo")
+        formatter = output_formats_module.OutputFormatter(fmt)
+        assert not formatter.echo_formatted_iterable(iter([]))
+        assert not mock_echo.call_count
+
 
 def test_to_cef_returns_cef_tagged_string(mock_file_event):
     cef_out = to_cef(mock_file_event)
@@ -757,7 +845,7 @@ class TestDataFrameOutputFormatter:
         output = formatter.get_formatted_output(self.test_df)
         assert (
             "".join(output)
-            == '{"string_column": "string1", "int_column": 42, "null_column": null}\n{"string_column": "string2", "int_column": 43, "null_column": null}\n'
+            == '{"string_column":"string1","int_column":42,"null_column":null}\n{"string_column":"string2","int_column":43,"null_column":null}\n'
         )
 
     def test_csv_formatter_converts_to_expected_string(self):
@@ -58,6 +58,33 @@ def test_get_stored_password_returns_expected_password(
     assert password.get_stored_password(profile) == "already stored password 123"
 
 
+def test_get_stored_password_when_called_twice_only_reads_keyring_once(
+    profile, keyring_password_getter
+):
+    password.get_stored_password(profile)
+    password.get_stored_password(profile)
+    assert keyring_password_getter.call_count == 1
+
+
+def test_get_stored_password_after_set_password_reads_keyring_again(
+    profile, keyring_password_getter
+):
+    password.get_stored_password(profile)
+    password.set_password(profile, "new_password")
+    password.get_stored_password(profile)
+    assert keyring_password_getter.call_count == 2
+
+
+def test_get_stored_password_after_delete_password_reads_keyring_again(
+    mocker, profile, keyring_password_getter
+):
+    mocker.patch("keyring.delete_password")
+    password.get_stored_password(profile)
+    password.delete_password(profile)
+    password.get_stored_password(profile)
+    assert keyring_password_getter.call_count == 2
+
+
 def test_set_password_uses_expected_service_name_username_and_password(
     profile, keyring_password_setter, keyring_password_getter
 ):
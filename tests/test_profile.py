@@ -64,7 +64,12 @@ class TestCode42Profile:
 
     def test_ignore_ssl_errors_returns_expected_value(self):
         mock_profile = create_mock_profile()
-        assert mock_profile.ignore_ssl_errors
+        assert mock_profile.ignore_ssl_errors is True
+
+    def test_ignore_ssl_errors_when_stored_as_false_returns_false(self):
+        mock_profile = create_mock_profile()
+        mock_profile._profile[ConfigAccessor.IGNORE_SSL_ERRORS_KEY] = "False"
+        assert mock_profile.ignore_ssl_errors is False
 
 
 def test_get_profile_returns_expected_profile(config_accessor):
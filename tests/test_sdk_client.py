@@ -4,6 +4,7 @@ import py42.sdk
 import py42.settings.debug as debug
 import pytest
 from py42.exceptions import Py42UnauthorizedError
+from py42.services._connection import ROOT_SESSION
 from requests import Response
 from requests.exceptions import ConnectionError
 from requests.exceptions import HTTPError
@@ -15,6 +16,18 @@ from code42cli.errors import LoggedCLIError
 from code42cli.main import cli
 from code42cli.options import CLIState
 from code42cli.sdk_client import create_sdk
+from code42cli.sdk_client import HTTP_POOL_MAXSIZE
+
+
+@pytest.fixture(autouse=True)
+def restore_root_session_adapters():
+    # create_sdk mounts an adapter on py42's process-wide session
+    original_adapters = {
+        prefix: ROOT_SESSION.get_adapter(prefix) for prefix in ("https://", "http://")
+    }
+    yield
+    for prefix, adapter in original_adapters.items():
+        ROOT_SESSION.mount(prefix, adapter)
 
 
 @pytest.fixture
@@ -50,7 +63,7 @@ def test_create_sdk_when_profile_has_ssl_errors_disabled_sets_py42_setting_and_p
     profile, mocker, capsys
 ):
     mock_py42 = mocker.patch("code42cli.sdk_client.py42")
-    profile.ignore_ssl_errors = "True"
+    profile.ignore_ssl_errors = True
     create_sdk(profile, False)
     output = capsys.readouterr()
     assert not mock_py42.settings.verify_ssl_certs
@@ -156,3 +169,13 @@ def test_totp_option_when_passed_is_passed_to_sdk_initialization(
     mock_py42.assert_called_once_with(
         profile.authority_url, profile.username, "password", totp=totp
     )
+
+
+def test_create_sdk_uses_expanded_connection_pool(
+    mock_sdk_factory, mock_profile_with_password
+):
+    create_sdk(mock_profile_with_password, False)
+    adapter = ROOT_SESSION.get_adapter("https://example.com")
+    pool_kwargs = adapter.poolmanager.connection_pool_kw
+    assert pool_kwargs["maxsize"] == HTTP_POOL_MAXSIZE
+    assert pool_kwargs["block"]
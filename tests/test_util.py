@@ -1,10 +1,18 @@
+import json
+from threading import Event
+
 import pytest
+from tests.conftest import create_mock_response
 
 from code42cli.util import _PADDING_SIZE
 from code42cli.util import does_user_agree
+from code42cli.util import dumps_json
 from code42cli.util import find_format_width
 from code42cli.util import format_string_list_to_columns
 from code42cli.util import get_url_parts
+from code42cli.util import iter_in_background
+from code42cli.util import load_response_json
+from code42cli.util import parse_timestamp
 
 TEST_HEADER = {"key1": "Column 1", "key2": "Column 10", "key3": "Column 100"}
 
@@ -169,3 +177,90 @@ def test_url_parts():
     server, port = get_url_parts("127.0.0.1")
     assert server == "127.0.0.1"
     assert port is None
+
+
+def test_load_response_json_returns_parsed_body(mocker):
+    response = create_mock_response(mocker, data={"fileEvents": [{"eventId": "1"}]})
+    assert load_response_json(response) == {"fileEvents": [{"eventId": "1"}]}
+
+
+@pytest.mark.parametrize("use_orjson", (True, False))
+def test_json_helpers_produce_same_output_with_and_without_orjson(mocker, use_orjson):
+    if not use_orjson:
+        mocker.patch("code42cli.util.orjson", None)
+    response = create_mock_response(mocker, data={"fileEvents": [{"eventId": "1"}]})
+    assert load_response_json(response) == {"fileEvents": [{"eventId": "1"}]}
+    assert (
+        dumps_json({"name": "caf\u00e9", 1: [None]})
+        == '{"name":"caf\u00e9","1":[null]}'
+    )
+
+
+def test_load_response_json_when_page_has_lone_surrogate_escape_returns_parsed_body(
+    mocker,
+):
+    data = '{"fileEvents": [{"fileName": "bad\\ud800name.txt"}]}'
+    response = create_mock_response(mocker, data=data)
+    assert load_response_json(response) == {
+        "fileEvents": [{"fileName": "bad\ud800name.txt"}]
+    }
+
+
+@pytest.mark.parametrize("use_orjson", (True, False))
+def test_dumps_json_when_value_not_utf8_encodable_or_too_large_escapes_it(
+    mocker, use_orjson
+):
+    if not use_orjson:
+        mocker.patch("code42cli.util.orjson", None)
+    event = {"fileName": "bad\ud800name.txt", "size": 2**70}
+    json_string = dumps_json(event)
+    json_string.encode("utf-8")
+    assert json.loads(json_string) == event
+
+
+def test_parse_timestamp_returns_expected_epoch_seconds():
+    assert parse_timestamp("2020-11-23T17:13:26.239647Z") == 1606151606.239647
+
+
+def test_iter_in_background_yields_all_items_in_order():
+    assert list(iter_in_background(iter(range(10)))) == list(range(10))
+
+
+def test_iter_in_background_reraises_error_from_iterable():
+    def gen():
+        yield 1
+        raise ValueError("test error")
+
+    results = iter_in_background(gen())
+    assert next(results) == 1
+    with pytest.raises(ValueError):
+        next(results)
+
+
+def test_iter_in_background_reraises_base_exception_from_iterable():
+    class TestBaseException(BaseException):
+        pass
+
+    def gen():
+        yield 1
+        raise TestBaseException()
+
+    results = iter_in_background(gen())
+    assert next(results) == 1
+    with pytest.raises(TestBaseException):
+        next(results)
+
+
+def test_iter_in_background_when_closed_early_stops_iterating_source():
+    source_closed = Event()
+
+    def gen():
+        try:
+            yield from range(100)
+        finally:
+            source_closed.set()
+
+    results = iter_in_background(gen(), maxsize=1)
+    assert next(results) == 0
+    results.close()
+    assert source_closed.wait(timeout=5)